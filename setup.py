@@ -26,9 +26,13 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "jsonschema>=4.0.0",
+        "pyyaml>=6.0",
         "cryptography>=40.0.0",
     ],
     extras_require={
+        "blake3": [
+            "blake3>=0.3.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
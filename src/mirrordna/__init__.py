@@ -12,22 +12,54 @@ This package provides the core protocol implementation including:
 
 __version__ = "1.0.0"
 
-from .config_loader import ConfigLoader, MasterCitation, VaultConfig
-from .checksum import (
-    compute_file_checksum,
-    compute_state_checksum,
-    compute_text_checksum,
-    verify_checksum
-)
-from .timeline import Timeline, TimelineEvent
-from .state_snapshot import (
-    StateSnapshot,
-    capture_snapshot,
-    serialize_snapshot,
-    save_snapshot,
-    load_snapshot,
-    compare_snapshots
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config_loader import ConfigLoader, MasterCitation, VaultConfig
+    from .checksum import (
+        compute_file_checksum,
+        compute_state_checksum,
+        compute_text_checksum,
+        verify_checksum
+    )
+    from .timeline import Timeline, TimelineEvent
+    from .state_snapshot import (
+        StateSnapshot,
+        capture_snapshot,
+        serialize_snapshot,
+        save_snapshot,
+        load_snapshot,
+        compare_snapshots
+    )
+
+# Public name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing the package stays cheap.
+_LAZY_IMPORTS = {
+    # Config loading
+    "ConfigLoader": "config_loader",
+    "MasterCitation": "config_loader",
+    "VaultConfig": "config_loader",
+    # Checksumming
+    "compute_file_checksum": "checksum",
+    "compute_state_checksum": "checksum",
+    "compute_text_checksum": "checksum",
+    "verify_checksum": "checksum",
+    # Timeline
+    "Timeline": "timeline",
+    "TimelineEvent": "timeline",
+    # State snapshots
+    "StateSnapshot": "state_snapshot",
+    "capture_snapshot": "state_snapshot",
+    "serialize_snapshot": "state_snapshot",
+    "save_snapshot": "state_snapshot",
+    "load_snapshot": "state_snapshot",
+    "compare_snapshots": "state_snapshot",
+}
+
+# Submodules the package used to import eagerly; keep them reachable as
+# attributes (e.g. mirrordna.timeline) without an explicit import
+_SUBMODULES = ("config_loader", "checksum", "timeline", "state_snapshot")
 
 __all__ = [
     # Config loading
@@ -50,3 +82,23 @@ __all__ = [
     "load_snapshot",
     "compare_snapshots",
 ]
+
+
+def __getattr__(name):
+    """Import public names and submodules on first access."""
+    if name in _SUBMODULES:
+        # import_module also binds the submodule as a package attribute
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
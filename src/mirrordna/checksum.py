@@ -2,20 +2,88 @@
 Checksum computation for MirrorDNA protocol.
 
 Provides SHA-256 checksumming for files, state data, and canonical representations.
+SHA-256 is the protocol default; other algorithms (including BLAKE3 when the
+optional blake3 package is installed) can be selected per call.
 """
 
 import hashlib
+import hmac
 import json
 from pathlib import Path
 from typing import Dict, Any, Union
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
 
-def compute_file_checksum(path: Union[str, Path]) -> str:
+# Read block size for file checksums
+_CHUNK_SIZE = 1 << 20
+
+
+def _new_hash(algorithm: str):
+    """
+    Create a hash object for the named algorithm.
+
+    Any fixed-length hashlib algorithm is accepted, plus "blake3" when
+    the blake3 package is installed.
+
+    Raises:
+        RuntimeError: If blake3 is requested but not installed
+        ValueError: If the algorithm is unknown or variable-length (shake_*)
+    """
+    if algorithm == "blake3":
+        if not BLAKE3_AVAILABLE:
+            raise RuntimeError(
+                "blake3 library not available. "
+                "Install with: pip install blake3"
+            )
+        return blake3.blake3()
+
+    hasher = hashlib.new(algorithm)
+    if hasher.digest_size == 0:
+        raise ValueError(
+            f"Variable-length hash algorithm not supported: {algorithm}"
+        )
+    return hasher
+
+
+def _hash_file(path: Union[str, Path], algorithm: str = "sha256"):
+    """Stream a file through a new hash object and return it."""
+    path = Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+
+            return hashlib.file_digest(f, lambda: _new_hash(algorithm))
+
+        hash_obj = _new_hash(algorithm)
+        buf = bytearray(_CHUNK_SIZE)
+        view = memoryview(buf)
+
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hash_obj.update(view[:n])
+
+    return hash_obj
+
+
+def compute_file_checksum(path: Union[str, Path], algorithm: str = "sha256") -> str:
     """
-    Compute SHA-256 checksum of a file.
+    Compute checksum of a file.
+
+    The file is streamed through the hash in fixed-size blocks, so memory use
+    stays constant regardless of file size.
 
     Args:
         path: Path to file
+        algorithm: Hash algorithm (sha256, blake2b, blake3, etc.)
 
     Returns:
         Hexadecimal checksum string
@@ -23,58 +91,64 @@ def compute_file_checksum(path: Union[str, Path]) -> str:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    path = Path(path)
+    return _hash_file(path, algorithm).hexdigest()
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
 
-    sha256 = hashlib.sha256()
+def _canonical_json(data: Dict[str, Any]) -> bytes:
+    """
+    Encode data as canonical JSON bytes.
+
+    The byte layout is part of the protocol (see docs/glossary.md) and must
+    not change: sorted keys, compact separators, ASCII-escaped output.
+    """
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('ascii')
+
 
-    with open(path, 'rb') as f:
-        # Read in chunks for large files
-        for chunk in iter(lambda: f.read(8192), b''):
-            sha256.update(chunk)
+def _hash_state(data: Dict[str, Any], algorithm: str = "sha256"):
+    """Hash the canonical JSON form of data and return the hash object."""
+    hash_obj = _new_hash(algorithm)
+    hash_obj.update(_canonical_json(data))
 
-    return sha256.hexdigest()
+    return hash_obj
 
 
-def compute_state_checksum(data: Dict[str, Any]) -> str:
+def _hash_text(text: str, algorithm: str = "sha256"):
+    """Hash UTF-8 encoded text and return the hash object."""
+    hash_obj = _new_hash(algorithm)
+    hash_obj.update(text.encode('utf-8'))
+
+    return hash_obj
+
+
+def compute_state_checksum(data: Dict[str, Any], algorithm: str = "sha256") -> str:
     """
-    Compute SHA-256 checksum of state data (dictionary).
+    Compute checksum of state data (dictionary).
 
     Creates canonical JSON representation with sorted keys to ensure
     deterministic checksums.
 
     Args:
         data: State data dictionary
+        algorithm: Hash algorithm (sha256, blake2b, blake3, etc.)
 
     Returns:
         Hexadecimal checksum string
     """
-    # Create canonical JSON representation
-    canonical_json = json.dumps(data, sort_keys=True, separators=(',', ':'))
-
-    # Compute checksum
-    sha256 = hashlib.sha256()
-    sha256.update(canonical_json.encode('utf-8'))
+    return _hash_state(data, algorithm).hexdigest()
 
-    return sha256.hexdigest()
 
-
-def compute_text_checksum(text: str) -> str:
+def compute_text_checksum(text: str, algorithm: str = "sha256") -> str:
     """
-    Compute SHA-256 checksum of text content.
+    Compute checksum of text content.
 
     Args:
         text: Text content
+        algorithm: Hash algorithm (sha256, blake2b, blake3, etc.)
 
     Returns:
         Hexadecimal checksum string
     """
-    sha256 = hashlib.sha256()
-    sha256.update(text.encode('utf-8'))
-
-    return sha256.hexdigest()
+    return _hash_text(text, algorithm).hexdigest()
 
 
 def verify_checksum(data: Union[str, Dict[str, Any], Path], expected_checksum: str) -> bool:
@@ -86,15 +160,28 @@ def verify_checksum(data: Union[str, Dict[str, Any], Path], expected_checksum: s
         expected_checksum: Expected checksum value
 
     Returns:
-        True if checksums match, False otherwise
+        True if checksums match, False otherwise (including when
+        expected_checksum is not valid hex)
     """
     if isinstance(data, (str, Path)) and Path(data).exists():
-        actual = compute_file_checksum(data)
+        actual = _hash_file(data).digest()
     elif isinstance(data, dict):
-        actual = compute_state_checksum(data)
+        actual = _hash_state(data).digest()
     elif isinstance(data, str):
-        actual = compute_text_checksum(data)
+        actual = _hash_text(data).digest()
     else:
         raise ValueError(f"Unsupported data type for checksum verification: {type(data)}")
 
-    return actual.lower() == expected_checksum.lower()
+    # Require exactly the hex digest length (either case). bytes.fromhex
+    # skips whitespace, but at this length any whitespace leaves too few
+    # hex digits, so the digest comparison below rejects it
+    if len(expected_checksum) != 2 * len(actual):
+        return False
+
+    # Compare raw digests
+    try:
+        expected = bytes.fromhex(expected_checksum)
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(actual, expected)
@@ -10,6 +10,7 @@ Provides verified configuration loading with:
 
 import json
 import hashlib
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
@@ -87,8 +88,6 @@ class ConfigLoader:
         Returns:
             Checksum metadata
         """
-        from datetime import datetime
-
         # Calculate checksum
         checksum_hash = self.calculate_checksum(config, checksum_algorithm)
 
@@ -102,13 +101,11 @@ class ConfigLoader:
 
         # Save config file
         config_file = self.config_dir / f"{name}.json"
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2, sort_keys=True)
+        config_file.write_text(json.dumps(config, indent=2, sort_keys=True))
 
         # Save checksum file
         checksum_file = self.config_dir / f"{name}.checksum.json"
-        with open(checksum_file, 'w') as f:
-            json.dump(asdict(checksum_meta), f, indent=2)
+        checksum_file.write_text(json.dumps(asdict(checksum_meta), indent=2))
 
         return checksum_meta
 
@@ -4,19 +4,38 @@ Configuration loader for MirrorDNA protocol documents.
 Loads and validates Master Citations, Vault configs, and other MirrorDNA protocol configurations.
 """
 
+import copy
 import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 try:
     import jsonschema
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
-from .checksum import compute_file_checksum, verify_checksum
+from .checksum import compute_file_checksum, compute_state_checksum, verify_checksum
+
+
+@lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, ino: int, mtime_ns: int, ctime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file.
+
+    Cached on the file's inode, modification time, change time and size, so
+    an unchanged file is parsed only once per process. The inode and ctime
+    catch replacements that preserve mtime and size (cp -p, rsync -t, tar),
+    since callers cannot set ctime.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 @dataclass
@@ -87,14 +106,24 @@ class ConfigLoader:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
+        if path.suffix in ['.yaml', '.yml']:
+            stat = path.stat()
+            try:
+                data = _parse_yaml_file(
+                    str(path.resolve()),
+                    stat.st_ino,
+                    stat.st_mtime_ns,
+                    stat.st_ctime_ns,
+                    stat.st_size
+                )
+            except NameError:
+                raise ImportError("PyYAML not installed. Install with: pip install pyyaml")
+
+            # Callers may mutate the result; never hand out the cached object
+            return copy.deepcopy(data)
+
         with open(path, 'r') as f:
-            if path.suffix in ['.yaml', '.yml']:
-                try:
-                    return yaml.safe_load(f)
-                except NameError:
-                    raise ImportError("PyYAML not installed. Install with: pip install pyyaml")
-            else:
-                return json.load(f)
+            return json.load(f)
 
     def _validate(self, data: Dict[str, Any], schema_name: str) -> None:
         """Validate data against schema."""
@@ -139,7 +168,6 @@ class ConfigLoader:
             data_without_checksum = {k: v for k, v in data.items() if k != 'checksum'}
             expected_checksum = data['checksum']
 
-            from .checksum import compute_state_checksum
             actual_checksum = compute_state_checksum(data_without_checksum)
 
             if actual_checksum != expected_checksum:
@@ -139,9 +139,11 @@ class ContinuityTracker:
             if not session:
                 break
 
-            lineage.insert(0, session)  # Prepend to list
+            lineage.append(session)
             current_session_id = session.get("parent_session_id")
 
+        # Walked from current to oldest; reverse once instead of prepending
+        lineage.reverse()
         return lineage
 
     def get_context(self, session_id: str) -> Dict[str, Any]:
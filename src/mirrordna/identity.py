@@ -4,12 +4,19 @@ Identity management for MirrorDNA.
 
 import secrets
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from .crypto import CryptoUtils
 from .validator import validate_schema
 from .storage import StorageAdapter, JSONFileStorage
 
+# ID prefix per identity type; the keys are the valid identity types
+_IDENTITY_TYPE_PREFIXES = {
+    "user": "usr",
+    "agent": "agt",
+    "system": "sys"
+}
+
 
 class IdentityManager:
     """Manages identity creation and validation."""
@@ -35,36 +42,26 @@ class IdentityManager:
         Returns:
             Generated identity ID
         """
-        type_prefix_map = {
-            "user": "usr",
-            "agent": "agt",
-            "system": "sys"
-        }
-
-        prefix = type_prefix_map.get(identity_type, "unk")
+        prefix = _IDENTITY_TYPE_PREFIXES.get(identity_type, "unk")
         suffix = secrets.token_hex(8)  # 16 characters
 
         return f"mdna_{prefix}_{suffix}"
 
-    def create_identity(
+    def _build_identity(
         self,
         identity_type: str,
         metadata: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Dict[str, Any], str]:
         """
-        Create a new identity.
-
-        Args:
-            identity_type: Type of identity (user, agent, system)
-            metadata: Optional metadata
+        Build and validate an identity record without storing it.
 
         Returns:
-            Identity record (includes _private_key field)
+            Tuple of (identity record, private key)
 
         Raises:
             ValueError: If identity_type is invalid or validation fails
         """
-        if identity_type not in ["user", "agent", "system"]:
+        if identity_type not in _IDENTITY_TYPE_PREFIXES:
             raise ValueError(f"Invalid identity_type: {identity_type}")
 
         # Generate ID and keypair
@@ -87,6 +84,28 @@ class IdentityManager:
         if not result.is_valid:
             raise ValueError(f"Identity validation failed: {', '.join(result.errors)}")
 
+        return identity, private_key
+
+    def create_identity(
+        self,
+        identity_type: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a new identity.
+
+        Args:
+            identity_type: Type of identity (user, agent, system)
+            metadata: Optional metadata
+
+        Returns:
+            Identity record (includes _private_key field)
+
+        Raises:
+            ValueError: If identity_type is invalid or validation fails
+        """
+        identity, private_key = self._build_identity(identity_type, metadata)
+
         # Store identity
         self.storage.create("identities", identity)
 
@@ -94,6 +113,34 @@ class IdentityManager:
         identity["_private_key"] = private_key
         return identity
 
+    def create_identities(self, identities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several identities in one storage batch.
+
+        All identities are generated and validated before anything is
+        stored, so an invalid entry leaves storage untouched.
+
+        Args:
+            identities: Identity definitions, each a dict of create_identity
+                arguments (identity_type, metadata)
+
+        Returns:
+            Identity records, in input order (each includes _private_key field)
+
+        Raises:
+            ValueError: If any identity_type is invalid or validation fails
+        """
+        built = [self._build_identity(**identity) for identity in identities]
+
+        # Store identities
+        self.storage.create_many("identities", [identity for identity, _ in built])
+
+        # Return identities with private keys (WARNING: Handle with care!)
+        for identity, private_key in built:
+            identity["_private_key"] = private_key
+
+        return [identity for identity, _ in built]
+
     def get_identity(self, identity_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve an identity by ID.
@@ -9,6 +9,9 @@ from typing import Dict, Any, Optional, List, Union
 from .validator import validate_schema
 from .storage import StorageAdapter, JSONFileStorage
 
+# Valid memory tiers
+_MEMORY_TIERS = ("short_term", "long_term", "episodic")
+
 
 class MemoryManager:
     """Manages memory records across tiers."""
@@ -34,7 +37,7 @@ class MemoryManager:
 
         return f"mem_{timestamp}_{suffix}"
 
-    def write_memory(
+    def _build_memory(
         self,
         content: Union[str, Dict[str, Any]],
         tier: str,
@@ -44,23 +47,12 @@ class MemoryManager:
         metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
-        Write a new memory.
-
-        Args:
-            content: Memory content (text or structured data)
-            tier: Memory tier (short_term, long_term, episodic)
-            session_id: Session where memory was created
-            agent_id: Agent that created the memory
-            user_id: User associated with the memory
-            metadata: Optional metadata (tags, relevance_score, etc.)
-
-        Returns:
-            Memory record
+        Build and validate a memory record without storing it.
 
         Raises:
             ValueError: If tier is invalid or validation fails
         """
-        if tier not in ["short_term", "long_term", "episodic"]:
+        if tier not in _MEMORY_TIERS:
             raise ValueError(f"Invalid tier: {tier}")
 
         memory_id = self._generate_memory_id()
@@ -85,11 +77,65 @@ class MemoryManager:
         if not result.is_valid:
             raise ValueError(f"Memory validation failed: {', '.join(result.errors)}")
 
+        return memory
+
+    def write_memory(
+        self,
+        content: Union[str, Dict[str, Any]],
+        tier: str,
+        session_id: str,
+        agent_id: str,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Write a new memory.
+
+        Args:
+            content: Memory content (text or structured data)
+            tier: Memory tier (short_term, long_term, episodic)
+            session_id: Session where memory was created
+            agent_id: Agent that created the memory
+            user_id: User associated with the memory
+            metadata: Optional metadata (tags, relevance_score, etc.)
+
+        Returns:
+            Memory record
+
+        Raises:
+            ValueError: If tier is invalid or validation fails
+        """
+        memory = self._build_memory(content, tier, session_id, agent_id, user_id, metadata)
+
         # Store memory
         self.storage.create("memories", memory)
 
         return memory
 
+    def write_memories(self, memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Write several memories in one storage batch.
+
+        All memories are validated before anything is stored, so an invalid
+        entry leaves storage untouched.
+
+        Args:
+            memories: Memory definitions, each a dict of write_memory arguments
+                (content, tier, session_id, agent_id, user_id, metadata)
+
+        Returns:
+            Memory records, in input order
+
+        Raises:
+            ValueError: If any tier is invalid or validation fails
+        """
+        records = [self._build_memory(**memory) for memory in memories]
+
+        # Store memories
+        self.storage.create_many("memories", records)
+
+        return records
+
     def read_memory(
         self,
         tier: Optional[str] = None,
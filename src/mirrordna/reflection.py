@@ -8,8 +8,11 @@ The reflection engine enables agents to:
 - Monitor behavioral alignment
 """
 
+import asyncio
+import functools
+import inspect
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -64,6 +67,20 @@ class ReflectionEngine:
         self.dna_manager = dna_manager or AgentDNAManager(self.storage)
         self._reflection_count = 0
 
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a storage or DNA manager call without blocking the event loop.
+
+        Synchronous adapters (such as JSONFileStorage) do file I/O, so their
+        calls are run in the default executor. Coroutine functions are
+        awaited directly.
+        """
+        if inspect.iscoroutinefunction(func):
+            return await func(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
     def _generate_reflection_id(self) -> str:
         """Generate a unique reflection ID."""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -121,7 +138,7 @@ class ReflectionEngine:
             }
         )
 
-        await self.storage.create("reflections", asdict(reflection))
+        await self._run_blocking(self.storage.create, "reflections", asdict(reflection))
         return reflection
 
     async def reflect_on_capability(
@@ -173,7 +190,7 @@ class ReflectionEngine:
             }
         )
 
-        await self.storage.create("reflections", asdict(reflection))
+        await self._run_blocking(self.storage.create, "reflections", asdict(reflection))
         return reflection
 
     async def reflect_on_state(
@@ -210,7 +227,7 @@ class ReflectionEngine:
             metadata={"state_snapshot": state_snapshot}
         )
 
-        await self.storage.create("reflections", asdict(reflection))
+        await self._run_blocking(self.storage.create, "reflections", asdict(reflection))
         return reflection
 
     async def meta_reflect(
@@ -250,7 +267,7 @@ class ReflectionEngine:
             metadata={"source_reflections": reflection_ids}
         )
 
-        await self.storage.create("reflections", asdict(reflection))
+        await self._run_blocking(self.storage.create, "reflections", asdict(reflection))
         return reflection
 
     async def get_reflections(
@@ -273,7 +290,7 @@ class ReflectionEngine:
         if reflection_type:
             filters["reflection_type"] = reflection_type.value
 
-        reflections = await self.storage.query("reflections", filters, limit)
+        reflections = await self._run_blocking(self.storage.query, "reflections", filters, limit)
 
         # Sort by timestamp (most recent first)
         reflections.sort(
@@ -291,7 +308,7 @@ class ReflectionEngine:
             Capability introspection data
         """
         # Get latest agent DNA
-        dna = self.dna_manager.get_latest_agent_dna(self.agent_id)
+        dna = await self._run_blocking(self.dna_manager.get_latest_agent_dna, self.agent_id)
 
         if not dna:
             return {
@@ -347,7 +364,7 @@ class ReflectionEngine:
         Returns:
             Alignment check result
         """
-        dna = self.dna_manager.get_latest_agent_dna(self.agent_id)
+        dna = await self._run_blocking(self.dna_manager.get_latest_agent_dna, self.agent_id)
 
         if not dna:
             return {
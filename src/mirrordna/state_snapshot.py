@@ -5,6 +5,7 @@ Captures current identity, continuity, and vault state for persistence and trans
 """
 
 import json
+import sys
 import yaml
 from datetime import datetime
 from pathlib import Path
@@ -13,8 +14,20 @@ from dataclasses import dataclass, asdict
 
 from .checksum import compute_state_checksum
 
+# slots=True requires Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Prefer the libyaml-backed safe loader/dumper when PyYAML was built with it.
+# libyaml may fold long quoted scalars differently from the pure-Python
+# emitter, so the YAML text can differ; the loaded data is the same.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Sections inspected by compare_snapshots, in report order
+_COMPARED_SECTIONS = ("identity_state", "continuity_state", "vault_state")
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class StateSnapshot:
     """Complete state snapshot for MirrorDNA instance."""
     snapshot_id: str
@@ -101,7 +114,7 @@ def serialize_snapshot(
 
     if format == "yaml":
         try:
-            return yaml.dump(data, default_flow_style=False, sort_keys=False)
+            return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
         except NameError:
             raise ImportError("PyYAML not installed. Install with: pip install pyyaml")
     else:
@@ -128,8 +141,8 @@ def save_snapshot(
 
     content = serialize_snapshot(snapshot, format)
 
-    with open(path, 'w') as f:
-        f.write(content)
+    # Serializers escape non-ASCII, so this is a single plain byte write
+    path.write_bytes(content.encode('utf-8'))
 
 
 def load_snapshot(path: Union[str, Path]) -> StateSnapshot:
@@ -151,14 +164,15 @@ def load_snapshot(path: Union[str, Path]) -> StateSnapshot:
     if not path.exists():
         raise FileNotFoundError(f"Snapshot file not found: {path}")
 
-    with open(path, 'r') as f:
-        if path.suffix in ['.yaml', '.yml']:
-            try:
-                data = yaml.safe_load(f)
-            except NameError:
-                raise ImportError("PyYAML not installed. Install with: pip install pyyaml")
-        else:
-            data = json.load(f)
+    raw = path.read_bytes()
+
+    if path.suffix in ['.yaml', '.yml']:
+        try:
+            data = yaml.load(raw, Loader=_YAML_LOADER)
+        except NameError:
+            raise ImportError("PyYAML not installed. Install with: pip install pyyaml")
+    else:
+        data = json.loads(raw)
 
     # Verify checksum
     stored_checksum = data.get('checksum')
@@ -179,6 +193,24 @@ def load_snapshot(path: Union[str, Path]) -> StateSnapshot:
     })
 
 
+def _diff_section(
+    old: Optional[Dict[str, Any]],
+    new: Optional[Dict[str, Any]]
+) -> Dict[str, List[str]]:
+    """Diff two state sections by top-level key."""
+    old = old or {}
+    new = new or {}
+
+    old_keys = old.keys()
+    new_keys = new.keys()
+
+    return {
+        "added": sorted(new_keys - old_keys),
+        "removed": sorted(old_keys - new_keys),
+        "changed": sorted(k for k in old_keys & new_keys if old[k] != new[k])
+    }
+
+
 def compare_snapshots(
     snapshot1: StateSnapshot,
     snapshot2: StateSnapshot
@@ -191,22 +223,24 @@ def compare_snapshots(
         snapshot2: Second snapshot
 
     Returns:
-        Dictionary describing differences
+        Dictionary describing differences. ``changed_sections`` lists the
+        sections that differ and ``section_changes`` maps each of them to
+        the keys added, removed, or changed within it.
     """
     differences = {
         "checksum_changed": snapshot1.checksum != snapshot2.checksum,
         "timestamp_delta": snapshot2.timestamp,  # Could compute time difference
-        "changed_sections": []
+        "changed_sections": [],
+        "section_changes": {}
     }
 
     # Check each major section
-    if snapshot1.identity_state != snapshot2.identity_state:
-        differences["changed_sections"].append("identity_state")
-
-    if snapshot1.continuity_state != snapshot2.continuity_state:
-        differences["changed_sections"].append("continuity_state")
+    for section in _COMPARED_SECTIONS:
+        old = getattr(snapshot1, section)
+        new = getattr(snapshot2, section)
 
-    if snapshot1.vault_state != snapshot2.vault_state:
-        differences["changed_sections"].append("vault_state")
+        if old != new:
+            differences["changed_sections"].append(section)
+            differences["section_changes"][section] = _diff_section(old, new)
 
     return differences
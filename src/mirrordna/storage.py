@@ -4,10 +4,21 @@ Storage layer interface and implementations for MirrorDNA.
 
 import json
 import os
+import threading
+from itertools import islice
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Primary key field per collection; other collections use "id"
+_ID_FIELDS = {
+    "identities": "identity_id",
+    "sessions": "session_id",
+    "memories": "memory_id",
+    "agent_dna": "agent_dna_id",
+    "reflections": "reflection_id"
+}
+
 
 class StorageAdapter(ABC):
     """Abstract base class for storage adapters."""
@@ -26,6 +37,22 @@ class StorageAdapter(ABC):
         """
         pass
 
+    def create_many(self, collection: str, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several records in a collection.
+
+        The default implementation calls create() for each record. Adapters
+        that can persist a batch in one write should override this.
+
+        Args:
+            collection: Collection name
+            records: Records to create
+
+        Returns:
+            Record IDs, in input order
+        """
+        return [self.create(collection, record) for record in records]
+
     @abstractmethod
     def read(self, collection: str, record_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -101,6 +128,11 @@ class JSONFileStorage(StorageAdapter):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+        # Writes are load-modify-save of a whole collection file; serialize
+        # them so callers on other threads (e.g. executor offload) cannot
+        # lose each other's records
+        self._write_lock = threading.RLock()
+
     def _get_collection_file(self, collection: str) -> Path:
         """Get the file path for a collection."""
         return self.storage_dir / f"{collection}.json"
@@ -109,51 +141,98 @@ class JSONFileStorage(StorageAdapter):
         """Load a collection from disk."""
         file_path = self._get_collection_file(collection)
 
-        if not file_path.exists():
+        # One open/read of raw bytes; json.loads detects the UTF encoding
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
             return {}
 
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return json.loads(raw)
 
     def _save_collection(self, collection: str, data: Dict[str, Dict[str, Any]]):
         """Save a collection to disk."""
         file_path = self._get_collection_file(collection)
 
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
-
-    def create(self, collection: str, record: Dict[str, Any]) -> str:
-        """Create a new record."""
-        # Determine ID field based on collection type
-        id_field_map = {
-            "identities": "identity_id",
-            "sessions": "session_id",
-            "memories": "memory_id",
-            "agent_dna": "agent_dna_id"
-        }
-
-        id_field = id_field_map.get(collection, "id")
+        # Serialize up front and write in one call, then swap the file into
+        # place so readers never see a partially written collection
+        payload = json.dumps(data, indent=2).encode('utf-8')
+
+        # Unique temp file per save so concurrent writers never share one.
+        # Opening with 0666 lets the umask decide the mode of new files,
+        # the same as a plain open() would.
+        tmp_path = file_path.with_name(
+            f".{file_path.name}.{os.urandom(8).hex()}.tmp"
+        )
+        fd = os.open(
+            tmp_path,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0),
+            0o666
+        )
+
+        replaced = False
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Keep the mode of an existing collection file
+            try:
+                os.chmod(tmp_path, file_path.stat().st_mode & 0o777)
+            except FileNotFoundError:
+                pass
+
+            os.replace(tmp_path, file_path)
+            replaced = True
+        finally:
+            if not replaced:
+                tmp_path.unlink(missing_ok=True)
+
+    def _add_record(
+        self,
+        collection: str,
+        data: Dict[str, Dict[str, Any]],
+        record: Dict[str, Any]
+    ) -> str:
+        """Add a record to loaded collection data, checking its ID."""
+        id_field = _ID_FIELDS.get(collection, "id")
 
         if id_field not in record:
             raise ValueError(f"Record must contain '{id_field}' field")
 
         record_id = record[id_field]
 
-        # Load collection
-        data = self._load_collection(collection)
-
         # Check for duplicates
         if record_id in data:
             raise ValueError(f"Record with ID '{record_id}' already exists in '{collection}'")
 
-        # Store record
         data[record_id] = record
 
-        # Save collection
-        self._save_collection(collection, data)
+        return record_id
+
+    def create(self, collection: str, record: Dict[str, Any]) -> str:
+        """Create a new record."""
+        with self._write_lock:
+            data = self._load_collection(collection)
+
+            record_id = self._add_record(collection, data, record)
+
+            self._save_collection(collection, data)
 
         return record_id
 
+    def create_many(self, collection: str, records: List[Dict[str, Any]]) -> List[str]:
+        """Create several records with a single load and save of the collection."""
+        with self._write_lock:
+            data = self._load_collection(collection)
+
+            # Nothing is written if any record is rejected
+            record_ids = [self._add_record(collection, data, record) for record in records]
+
+            self._save_collection(collection, data)
+
+        return record_ids
+
     def read(self, collection: str, record_id: str) -> Optional[Dict[str, Any]]:
         """Read a record by ID."""
         data = self._load_collection(collection)
@@ -161,30 +240,53 @@ class JSONFileStorage(StorageAdapter):
 
     def update(self, collection: str, record_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a record."""
-        data = self._load_collection(collection)
+        with self._write_lock:
+            data = self._load_collection(collection)
 
-        if record_id not in data:
-            return None
+            if record_id not in data:
+                return None
 
-        # Update fields
-        data[record_id].update(updates)
+            # Update fields
+            data[record_id].update(updates)
 
-        # Save collection
-        self._save_collection(collection, data)
+            # Save collection
+            self._save_collection(collection, data)
 
         return data[record_id]
 
     def delete(self, collection: str, record_id: str) -> bool:
         """Delete a record."""
-        data = self._load_collection(collection)
+        with self._write_lock:
+            data = self._load_collection(collection)
+
+            if record_id not in data:
+                return False
 
-        if record_id not in data:
-            return False
+            del data[record_id]
 
-        del data[record_id]
+            # Save collection
+            self._save_collection(collection, data)
 
-        # Save collection
-        self._save_collection(collection, data)
+        return True
+
+    @staticmethod
+    def _matches(record: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        """Check whether a record matches all filters."""
+        for key, value in filters.items():
+            # Support nested keys like "source.user_id"
+            if '.' in key:
+                record_value = record
+                for part in key.split('.'):
+                    if isinstance(record_value, dict) and part in record_value:
+                        record_value = record_value[part]
+                    else:
+                        record_value = None
+                        break
+            else:
+                record_value = record.get(key)
+
+            if record_value != value:
+                return False
 
         return True
 
@@ -192,35 +294,11 @@ class JSONFileStorage(StorageAdapter):
         """Query records with filters."""
         data = self._load_collection(collection)
 
-        results = list(data.values())
+        results = data.values()
 
         # Apply filters if provided
         if filters:
-            filtered_results = []
-            for record in results:
-                match = True
-                for key, value in filters.items():
-                    # Support nested keys like "source.user_id"
-                    if '.' in key:
-                        parts = key.split('.')
-                        record_value = record
-                        for part in parts:
-                            if isinstance(record_value, dict) and part in record_value:
-                                record_value = record_value[part]
-                            else:
-                                record_value = None
-                                break
-                    else:
-                        record_value = record.get(key)
-
-                    if record_value != value:
-                        match = False
-                        break
-
-                if match:
-                    filtered_results.append(record)
-
-            results = filtered_results
+            results = (record for record in results if self._matches(record, filters))
 
-        # Apply limit
-        return results[:limit]
+        # Apply limit, stopping as soon as enough records match
+        return list(islice(results, max(limit, 0)))
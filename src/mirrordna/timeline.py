@@ -5,13 +5,19 @@ Provides in-memory and file-backed timeline for tracking continuity events.
 """
 
 import json
+import sys
+from collections import Counter
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
 from dataclasses import dataclass, asdict
 
+# Events are created in bulk; drop the per-instance __dict__ where supported
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TimelineEvent:
     """Single event in MirrorDNA timeline."""
     id: str
@@ -40,10 +46,18 @@ class Timeline:
         self.events: List[TimelineEvent] = []
         self._event_counter = 0
 
-    def _generate_event_id(self) -> str:
-        """Generate unique event ID."""
+    def _generate_event_id(self, iso_timestamp: Optional[str] = None) -> str:
+        """
+        Generate unique event ID.
+
+        Args:
+            iso_timestamp: ISO 8601 timestamp to derive the ID from (current
+                UTC time if None)
+        """
         self._event_counter += 1
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        iso = iso_timestamp or datetime.utcnow().isoformat()
+        # YYYYMMDDHHMMSS sliced from the ISO string; avoids a strftime call
+        timestamp = iso[0:4] + iso[5:7] + iso[8:10] + iso[11:13] + iso[14:16] + iso[17:19]
         return f"evt_{timestamp}_{self._event_counter:04d}"
 
     def append_event(
@@ -65,9 +79,11 @@ class Timeline:
         Returns:
             Created TimelineEvent
         """
+        now = datetime.utcnow().isoformat()
+
         event = TimelineEvent(
-            id=self._generate_event_id(),
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            id=self._generate_event_id(now),
+            timestamp=now + "Z",
             event_type=event_type,
             actor=actor,
             payload=payload or {},
@@ -77,6 +93,49 @@ class Timeline:
         self.events.append(event)
         return event
 
+    def _select_events(
+        self,
+        event_type: Optional[str],
+        actor: Optional[str]
+    ) -> Iterable[TimelineEvent]:
+        """Return an iterable of events matching the filters, in order."""
+        # Single lazy pass over self.events with both filters fused, so
+        # callers applying a limit stop scanning as soon as it is reached
+        if event_type and actor:
+            return (e for e in self.events if e.event_type == event_type and e.actor == actor)
+
+        if event_type:
+            return (e for e in self.events if e.event_type == event_type)
+
+        if actor:
+            return (e for e in self.events if e.actor == actor)
+
+        return self.events
+
+    def iter_events(
+        self,
+        event_type: Optional[str] = None,
+        actor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[TimelineEvent]:
+        """
+        Iterate over events with optional filtering, without building a list.
+
+        Args:
+            event_type: Filter by event type
+            actor: Filter by actor
+            limit: Maximum number of events to yield
+
+        Returns:
+            Iterator over matching TimelineEvent objects
+        """
+        matches = self._select_events(event_type, actor)
+
+        if limit:
+            return islice(matches, limit)
+
+        return iter(matches)
+
     def get_events(
         self,
         event_type: Optional[str] = None,
@@ -94,18 +153,15 @@ class Timeline:
         Returns:
             List of matching TimelineEvent objects
         """
-        filtered = self.events
-
-        if event_type:
-            filtered = [e for e in filtered if e.event_type == event_type]
-
-        if actor:
-            filtered = [e for e in filtered if e.actor == actor]
+        matches = self._select_events(event_type, actor)
 
         if limit:
-            filtered = filtered[:limit]
+            return list(islice(matches, limit))
+
+        if matches is self.events:
+            return self.events
 
-        return filtered
+        return list(matches)
 
     def get_event_by_id(self, event_id: str) -> Optional[TimelineEvent]:
         """
@@ -146,8 +202,9 @@ class Timeline:
             "events": self.export_events()
         }
 
-        with open(path, 'w') as f:
-            json.dump(timeline_data, f, indent=2)
+        # Serialize before opening so an unserializable payload cannot
+        # truncate an existing timeline file
+        path.write_text(json.dumps(timeline_data, indent=2))
 
     @classmethod
     def load_from_file(cls, path: Union[str, Path]) -> "Timeline":
@@ -192,17 +249,13 @@ class Timeline:
         Returns:
             Dictionary with timeline statistics
         """
-        event_types = {}
-        actors = set()
-
-        for event in self.events:
-            event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
-            actors.add(event.actor)
+        event_types = Counter(event.event_type for event in self.events)
+        actors = {event.actor for event in self.events}
 
         return {
             "timeline_id": self.timeline_id,
             "total_events": len(self.events),
-            "event_types": event_types,
+            "event_types": dict(event_types),
             "unique_actors": len(actors),
             "first_event": self.events[0].timestamp if self.events else None,
             "last_event": self.events[-1].timestamp if self.events else None
@@ -6,9 +6,23 @@ import pytest
 import tempfile
 from pathlib import Path
 
+import mirrordna.identity
+import mirrordna.memory
+from mirrordna.validator import ValidationResult
+
 
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Create a temporary directory for test data."""
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
+
+
+@pytest.fixture
+def skip_schema_validation(monkeypatch):
+    """Accept every record so batch tests do not depend on schema files."""
+    def accept(data, schema_name):
+        return ValidationResult(is_valid=True, errors=[], schema_name=schema_name)
+
+    monkeypatch.setattr(mirrordna.identity, "validate_schema", accept)
+    monkeypatch.setattr(mirrordna.memory, "validate_schema", accept)
@@ -2,6 +2,8 @@
 Tests for checksum computation and verification.
 """
 
+import hashlib
+import json
 import pytest
 from pathlib import Path
 from mirrordna import (
@@ -107,6 +109,15 @@ class TestChecksumComputation:
 
         assert len(checksum) == 64
 
+    def test_compute_state_checksum_canonical_form(self):
+        """Test that checksum matches the documented canonical JSON form."""
+        state = {"name": "Ünïcode 世界", "values": [1, 2.5, None, True]}
+
+        canonical = json.dumps(state, sort_keys=True, separators=(',', ':'))
+        expected = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+        assert compute_state_checksum(state) == expected
+
     def test_compute_file_checksum(self, tmp_path):
         """Test computing checksum of file."""
         # Create test file
@@ -155,6 +166,79 @@ class TestChecksumComputation:
 
         assert len(checksum) == 64
 
+    def test_compute_file_checksum_large_file(self, tmp_path):
+        """Test checksum of file spanning multiple read blocks."""
+        content = bytes(range(256)) * 8193
+        large_file = tmp_path / "large.dat"
+        large_file.write_bytes(content)
+
+        checksum = compute_file_checksum(large_file)
+
+        assert checksum == hashlib.sha256(content).hexdigest()
+
+    def test_compute_file_checksum_without_file_digest(self, tmp_path, monkeypatch):
+        """Test chunked fallback used when hashlib.file_digest is unavailable."""
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+        content = bytes(range(256)) * 8193
+        large_file = tmp_path / "large.dat"
+        large_file.write_bytes(content)
+
+        checksum = compute_file_checksum(large_file)
+
+        assert checksum == hashlib.sha256(content).hexdigest()
+
+    def test_compute_file_checksum_algorithm(self, tmp_path):
+        """Test computing file checksum with alternate algorithm."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"Test file content")
+
+        checksum = compute_file_checksum(test_file, algorithm="blake2b")
+
+        assert checksum == hashlib.blake2b(b"Test file content").hexdigest()
+
+    def test_compute_text_checksum_algorithm(self):
+        """Test computing text checksum with alternate algorithm."""
+        checksum = compute_text_checksum("Test", algorithm="blake2b")
+
+        assert checksum == hashlib.blake2b(b"Test").hexdigest()
+
+    def test_compute_state_checksum_algorithm(self):
+        """Test that algorithm choice changes state checksum."""
+        state = {"id": "test_001"}
+
+        sha256_checksum = compute_state_checksum(state)
+        blake2b_checksum = compute_state_checksum(state, algorithm="blake2b")
+
+        assert len(blake2b_checksum) == 128
+        assert blake2b_checksum != sha256_checksum
+
+    def test_compute_text_checksum_blake3(self):
+        """Test computing text checksum with BLAKE3."""
+        blake3 = pytest.importorskip("blake3")
+
+        checksum = compute_text_checksum("Test", algorithm="blake3")
+
+        assert checksum == blake3.blake3(b"Test").hexdigest()
+
+    def test_unknown_algorithm(self):
+        """Test error for unsupported hash algorithm."""
+        with pytest.raises(ValueError):
+            compute_text_checksum("Test", algorithm="not-a-hash")
+
+    @pytest.mark.parametrize("algorithm", ["shake_128", "shake_256"])
+    def test_variable_length_algorithm_rejected(self, tmp_path, algorithm):
+        """Test that shake algorithms, which need a digest length, are rejected."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Test")
+
+        with pytest.raises(ValueError):
+            compute_text_checksum("Test", algorithm=algorithm)
+        with pytest.raises(ValueError):
+            compute_state_checksum({"a": 1}, algorithm=algorithm)
+        with pytest.raises(ValueError):
+            compute_file_checksum(test_file, algorithm=algorithm)
+
 
 class TestChecksumVerification:
     """Test checksum verification."""
@@ -230,6 +314,24 @@ class TestChecksumVerification:
         # Test with lowercase checksum
         assert verify_checksum(text, checksum.lower()) is True
 
+    def test_verify_checksum_malformed_expected(self):
+        """Test that non-hex or truncated checksums fail verification."""
+        text = "Test"
+        checksum = compute_text_checksum(text)
+
+        assert verify_checksum(text, "not-a-checksum") is False
+        assert verify_checksum(text, checksum[:-2]) is False
+
+    def test_verify_checksum_rejects_whitespace(self):
+        """Test that padded or spaced-out checksums fail verification."""
+        text = "Test"
+        checksum = compute_text_checksum(text)
+        spaced = " ".join(checksum[i:i + 2] for i in range(0, len(checksum), 2))
+
+        assert verify_checksum(text, f" {checksum}\n") is False
+        assert verify_checksum(text, f" {checksum[:-1]}") is False
+        assert verify_checksum(text, spaced) is False
+
 
 class TestEdgeCases:
     """Test edge cases for checksum functions."""
@@ -5,6 +5,7 @@ Tests for ConfigLoader - Master Citation and Vault Config loading.
 import pytest
 import yaml
 import json
+import os
 from pathlib import Path
 from mirrordna import ConfigLoader, MasterCitation, VaultConfig, compute_state_checksum
 
@@ -257,6 +258,53 @@ class TestConfigLoader:
         assert citation.metadata["display_name"] == "Test Agent"
         assert "test" in citation.metadata["tags"]
 
+    def test_yaml_reload_after_modification(self, tmp_path):
+        """Test that a modified YAML file is re-parsed."""
+        events_path = tmp_path / "events.yaml"
+        with open(events_path, "w") as f:
+            yaml.dump({"events": [{"id": "evt_1"}]}, f)
+
+        loader = ConfigLoader()
+        assert loader.load_timeline_events(events_path, validate_events=False) == [{"id": "evt_1"}]
+
+        with open(events_path, "w") as f:
+            yaml.dump({"events": [{"id": "evt_1"}, {"id": "evt_2"}]}, f)
+
+        events = loader.load_timeline_events(events_path, validate_events=False)
+        assert [e["id"] for e in events] == ["evt_1", "evt_2"]
+
+    def test_yaml_reload_after_replace_with_preserved_mtime(self, tmp_path):
+        """Test that a same-size replacement with a copied mtime is re-parsed."""
+        events_path = tmp_path / "events.yaml"
+        events_path.write_text("events:\n- id: evt_1\n")
+
+        loader = ConfigLoader()
+        assert loader.load_timeline_events(events_path, validate_events=False) == [{"id": "evt_1"}]
+
+        # Like cp -p / rsync -t: same size, original mtime, swapped into place
+        original = events_path.stat()
+        replacement = tmp_path / "events.yaml.new"
+        replacement.write_text("events:\n- id: evt_2\n")
+        os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+        os.replace(replacement, events_path)
+
+        events = loader.load_timeline_events(events_path, validate_events=False)
+        assert events == [{"id": "evt_2"}]
+
+    def test_yaml_results_are_independent(self, tmp_path):
+        """Test that mutating loaded YAML data doesn't affect later loads."""
+        events_path = tmp_path / "events.yaml"
+        with open(events_path, "w") as f:
+            yaml.dump({"events": [{"id": "evt_1"}]}, f)
+
+        loader = ConfigLoader()
+        events = loader.load_timeline_events(events_path, validate_events=False)
+        events[0]["id"] = "mutated"
+        events.append({"id": "extra"})
+
+        reloaded = ConfigLoader().load_timeline_events(events_path, validate_events=False)
+        assert reloaded == [{"id": "evt_1"}]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -137,3 +137,33 @@ def test_invalid_identity_type(temp_storage):
 
     with pytest.raises(ValueError):
         identity_mgr.create_identity("invalid_type")
+
+
+def test_create_identities_batch(temp_storage, skip_schema_validation):
+    """Test creating several identities in one batch."""
+    identity_mgr = IdentityManager(storage=temp_storage)
+
+    identities = identity_mgr.create_identities([
+        {"identity_type": "user", "metadata": {"name": "Test User"}},
+        {"identity_type": "agent"}
+    ])
+
+    assert [i["identity_type"] for i in identities] == ["user", "agent"]
+    assert all("_private_key" in i for i in identities)
+
+    stored = identity_mgr.get_identity(identities[0]["identity_id"])
+    assert stored["metadata"]["name"] == "Test User"
+    assert "_private_key" not in stored
+
+
+def test_create_identities_invalid_type(temp_storage, skip_schema_validation):
+    """Test that an invalid entry leaves storage untouched."""
+    identity_mgr = IdentityManager(storage=temp_storage)
+
+    with pytest.raises(ValueError, match="Invalid identity_type: invalid_type"):
+        identity_mgr.create_identities([
+            {"identity_type": "user"},
+            {"identity_type": "invalid_type"}
+        ])
+
+    assert temp_storage.query("identities") == []
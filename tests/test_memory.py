@@ -69,6 +69,51 @@ def test_write_episodic_memory(temp_storage):
     assert memory["content"]["event"] == "First conversation"
 
 
+def test_write_memories_batch(temp_storage, skip_schema_validation):
+    """Test writing several memories in one batch."""
+    memory_mgr = MemoryManager(storage=temp_storage)
+
+    memories = memory_mgr.write_memories([
+        {
+            "content": f"Batch memory {i}",
+            "tier": "short_term",
+            "session_id": "sess_20250101_batch01",
+            "agent_id": "mdna_agt_batchagent01",
+            "user_id": "mdna_usr_batchuser001"
+        }
+        for i in range(3)
+    ])
+
+    assert len(memories) == 3
+    for memory in memories:
+        assert memory_mgr.get_memory(memory["memory_id"]) == memory
+
+
+def test_write_memories_invalid_tier(temp_storage, skip_schema_validation):
+    """Test that an invalid tier rejects the whole batch."""
+    memory_mgr = MemoryManager(storage=temp_storage)
+
+    with pytest.raises(ValueError, match="Invalid tier: forever"):
+        memory_mgr.write_memories([
+            {
+                "content": "Valid",
+                "tier": "short_term",
+                "session_id": "sess_20250101_batch01",
+                "agent_id": "mdna_agt_batchagent01",
+                "user_id": "mdna_usr_batchuser001"
+            },
+            {
+                "content": "Invalid",
+                "tier": "forever",
+                "session_id": "sess_20250101_batch01",
+                "agent_id": "mdna_agt_batchagent01",
+                "user_id": "mdna_usr_batchuser001"
+            }
+        ])
+
+    assert memory_mgr.read_memory() == []
+
+
 def test_read_memory_by_tier(temp_storage):
     """Test reading memories by tier."""
     memory_mgr = MemoryManager(storage=temp_storage)
@@ -0,0 +1,45 @@
+"""
+Tests for package-level lazy exports.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def run_fresh(code):
+    """Run code in a new interpreter so no submodule is preloaded."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+
+
+@pytest.mark.parametrize("submodule", ["config_loader", "checksum", "timeline", "state_snapshot"])
+def test_submodule_attribute_access(submodule):
+    """Test that submodules are reachable as package attributes."""
+    result = run_fresh(f"import mirrordna; print(mirrordna.{submodule}.__name__)")
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == f"mirrordna.{submodule}"
+
+
+def test_import_does_not_load_submodules():
+    """Test that importing the package defers submodule imports."""
+    result = run_fresh("import sys, mirrordna; print('mirrordna.timeline' in sys.modules)")
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_unknown_attribute():
+    """Test that unknown names still raise AttributeError."""
+    import mirrordna
+
+    with pytest.raises(AttributeError):
+        mirrordna.not_a_real_name
@@ -0,0 +1,53 @@
+"""
+Tests for reflection module.
+"""
+
+import asyncio
+import pytest
+from mirrordna.storage import JSONFileStorage
+from mirrordna.reflection import ReflectionEngine, ReflectionType
+import tempfile
+from pathlib import Path
+
+
+@pytest.fixture
+def engine():
+    """Create a reflection engine backed by temporary storage."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = JSONFileStorage(Path(tmpdir))
+        yield ReflectionEngine("agent_1", storage)
+
+
+def test_reflect_on_state_persists(engine):
+    """Test that reflections are stored through a synchronous adapter."""
+    reflection = asyncio.run(engine.reflect_on_state({"tasks": 3}, ["stable"]))
+
+    stored = engine.storage.read("reflections", reflection.reflection_id)
+
+    assert stored["reflection_type"] == "state"
+
+
+def test_get_reflections(engine):
+    """Test querying stored reflections by type."""
+    asyncio.run(engine.reflect_on_state({"tasks": 3}, ["stable"]))
+
+    reflections = asyncio.run(engine.get_reflections(reflection_type=ReflectionType.STATE))
+
+    assert len(reflections) == 1
+    assert reflections[0]["agent_id"] == "agent_1"
+
+
+def test_concurrent_reflections_all_persist(engine):
+    """Test that reflections gathered concurrently are all stored."""
+    async def reflect_many():
+        return await asyncio.gather(*(
+            engine.reflect_on_state({"tasks": i}, ["stable"])
+            for i in range(20)
+        ))
+
+    reflections = asyncio.run(reflect_many())
+
+    stored = engine.storage.query("reflections", limit=100)
+
+    assert len({r.reflection_id for r in reflections}) == 20
+    assert len(stored) == 20
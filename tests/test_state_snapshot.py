@@ -4,6 +4,7 @@ Tests for StateSnapshot capture and management.
 
 import pytest
 import json
+from dataclasses import asdict
 from pathlib import Path
 from mirrordna import (
     StateSnapshot,
@@ -211,6 +212,29 @@ class TestSnapshotPersistence:
         assert loaded.snapshot_id == "test_yaml"
         assert loaded.identity_state == {"id": "dave"}
 
+    def test_load_snapshot_yaml_long_unicode_round_trip(self, tmp_path):
+        """Test that long escaped YAML scalars load back to the same state."""
+        pytest.importorskip("yaml")
+
+        # Over 80 columns with non-ASCII text, so the emitter folds a
+        # double-quoted scalar; libyaml and pure Python fold differently,
+        # so only the loaded data is pinned, not the text
+        note = "Café déjà vu — naïve résumé façade \u2603 " * 4
+        original = capture_snapshot(
+            "test_yaml_unicode",
+            identity_state={"id": "dave", "note": note},
+            continuity_state={"history": [note.upper(), "\t tab and \\ slash"]}
+        )
+
+        file_path = tmp_path / "snapshot.yaml"
+        save_snapshot(original, file_path)
+
+        loaded = load_snapshot(file_path)
+
+        assert loaded == original
+        loaded_data = {k: v for k, v in asdict(loaded).items() if k != "checksum"}
+        assert compute_state_checksum(loaded_data) == original.checksum
+
     def test_load_snapshot_not_found(self):
         """Test error when loading non-existent snapshot."""
         with pytest.raises(FileNotFoundError):
@@ -341,6 +365,35 @@ class TestSnapshotComparison:
         assert "continuity_state" in diff["changed_sections"]
         assert "vault_state" not in diff["changed_sections"]
 
+    def test_compare_section_key_changes(self):
+        """Test key-level differences within changed sections."""
+        snapshot1 = capture_snapshot(
+            "test1",
+            identity_state={"id": "alice", "role": "admin", "legacy": True},
+            continuity_state={"sessions": 5}
+        )
+
+        snapshot2 = capture_snapshot(
+            "test2",
+            identity_state={"id": "alice", "role": "user", "email": "a@example.com"},
+            continuity_state={"sessions": 5},
+            vault_state={"entries": 1}
+        )
+
+        diff = compare_snapshots(snapshot1, snapshot2)
+
+        assert diff["section_changes"]["identity_state"] == {
+            "added": ["email"],
+            "removed": ["legacy"],
+            "changed": ["role"]
+        }
+        assert diff["section_changes"]["vault_state"] == {
+            "added": ["entries"],
+            "removed": [],
+            "changed": []
+        }
+        assert "continuity_state" not in diff["section_changes"]
+
 
 class TestSnapshotIntegrity:
     """Test snapshot checksum integrity."""
@@ -398,6 +451,22 @@ class TestSnapshotIntegrity:
 
         assert loaded.checksum == original.checksum
 
+    def test_round_trip_large_integers(self, tmp_path):
+        """Test round trip of integers wider than 64 bits."""
+        original = capture_snapshot(
+            "test_bigint",
+            identity_state={"id": "alice", "counter": 2 ** 80},
+            continuity_state={"sessions": 3}
+        )
+
+        file_path = tmp_path / "snapshot.json"
+        save_snapshot(original, file_path)
+
+        loaded = load_snapshot(file_path)
+
+        assert loaded.identity_state["counter"] == 2 ** 80
+        assert loaded.checksum == original.checksum
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
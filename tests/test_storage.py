@@ -0,0 +1,147 @@
+"""
+Tests for storage module.
+"""
+
+import os
+import pytest
+import threading
+from mirrordna.storage import JSONFileStorage
+import tempfile
+from pathlib import Path
+
+
+@pytest.fixture
+def temp_storage():
+    """Create temporary storage for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = JSONFileStorage(Path(tmpdir))
+        yield storage
+
+
+def test_create_and_read(temp_storage):
+    """Test creating and reading a record."""
+    record_id = temp_storage.create("identities", {"identity_id": "mdna_usr_1", "name": "a"})
+
+    assert record_id == "mdna_usr_1"
+    assert temp_storage.read("identities", "mdna_usr_1")["name"] == "a"
+
+
+def test_create_requires_id_field(temp_storage):
+    """Test that records without the collection ID field are rejected."""
+    with pytest.raises(ValueError):
+        temp_storage.create("identities", {"id": "mdna_usr_1"})
+
+
+def test_create_duplicate(temp_storage):
+    """Test that duplicate IDs are rejected."""
+    temp_storage.create("test_collection", {"id": "rec_1"})
+
+    with pytest.raises(ValueError):
+        temp_storage.create("test_collection", {"id": "rec_1"})
+
+
+def test_create_many(temp_storage):
+    """Test creating several records in one call."""
+    records = [{"id": f"rec_{i}", "data": "test"} for i in range(5)]
+
+    record_ids = temp_storage.create_many("test_collection", records)
+
+    assert record_ids == [f"rec_{i}" for i in range(5)]
+    assert len(temp_storage.query("test_collection")) == 5
+    assert temp_storage.read("test_collection", "rec_3")["data"] == "test"
+
+
+def test_create_many_rejects_duplicates_atomically(temp_storage):
+    """Test that a duplicate in a batch leaves storage untouched."""
+    temp_storage.create("test_collection", {"id": "rec_1"})
+
+    with pytest.raises(ValueError):
+        temp_storage.create_many("test_collection", [{"id": "rec_2"}, {"id": "rec_1"}])
+
+    assert temp_storage.read("test_collection", "rec_2") is None
+    assert len(temp_storage.query("test_collection")) == 1
+
+
+def test_query_filters_and_limit(temp_storage):
+    """Test querying with nested filters and a limit."""
+    for i in range(5):
+        temp_storage.create("test_collection", {
+            "id": f"rec_{i}",
+            "source": {"user_id": "alice" if i % 2 == 0 else "bob"}
+        })
+
+    results = temp_storage.query("test_collection", {"source.user_id": "alice"}, limit=2)
+
+    assert [r["id"] for r in results] == ["rec_0", "rec_2"]
+
+
+def test_save_leaves_no_temp_files(temp_storage):
+    """Test that collection writes replace the file without leftovers."""
+    temp_storage.create("test_collection", {"id": "rec_1"})
+    temp_storage.create("test_collection", {"id": "rec_2"})
+
+    files = sorted(p.name for p in temp_storage.storage_dir.iterdir())
+
+    assert files == ["test_collection.json"]
+    assert len(temp_storage.query("test_collection")) == 2
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes only")
+def test_new_collection_file_follows_umask(temp_storage):
+    """Test that new collection files get the mode a plain open() would."""
+    old_umask = os.umask(0o022)
+    try:
+        temp_storage.create("test_collection", {"id": "rec_1"})
+    finally:
+        os.umask(old_umask)
+
+    file_path = temp_storage.storage_dir / "test_collection.json"
+    assert file_path.stat().st_mode & 0o777 == 0o644
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes only")
+def test_save_keeps_existing_file_mode(temp_storage):
+    """Test that rewriting a collection keeps its current mode."""
+    temp_storage.create("test_collection", {"id": "rec_1"})
+    file_path = temp_storage.storage_dir / "test_collection.json"
+    os.chmod(file_path, 0o640)
+
+    temp_storage.create("test_collection", {"id": "rec_2"})
+
+    assert file_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_interrupted_save_removes_temp_file(temp_storage, monkeypatch):
+    """Test that an interrupt mid-write does not leave a temp file behind."""
+    def interrupt(fd):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(os, "fsync", interrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        temp_storage.create("test_collection", {"id": "rec_1"})
+
+    assert list(temp_storage.storage_dir.iterdir()) == []
+
+
+def test_concurrent_saves_use_separate_temp_files(temp_storage):
+    """Test that overlapping saves of one collection do not collide."""
+    errors = []
+
+    def save(i):
+        try:
+            temp_storage._save_collection("test_collection", {f"rec_{i}": {"id": f"rec_{i}"}})
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    files = sorted(p.name for p in temp_storage.storage_dir.iterdir())
+
+    assert errors == []
+    assert files == ["test_collection.json"]
+    assert len(temp_storage.query("test_collection")) == 1
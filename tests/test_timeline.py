@@ -117,6 +117,15 @@ class TestTimelineEvents:
         # Event IDs should contain incrementing counters
         assert event1.id < event2.id
 
+    def test_event_id_matches_timestamp(self):
+        """Test that event ID and timestamp come from the same instant."""
+        timeline = Timeline("test")
+
+        event = timeline.append_event("test_event", "actor")
+
+        compact = event.timestamp[:19].replace("-", "").replace("T", "").replace(":", "")
+        assert event.id.startswith(f"evt_{compact}_")
+
 
 class TestTimelineQuerying:
     """Test timeline query operations."""
@@ -171,6 +180,76 @@ class TestTimelineQuerying:
 
         assert len(events) == 2
 
+    def test_get_events_filtered_with_limit(self, populated_timeline):
+        """Test that limit applies after filtering, preserving order."""
+        events = populated_timeline.get_events(actor="agent_001", limit=2)
+
+        assert [e.event_type for e in events] == ["session_start", "memory_created"]
+
+    def test_iter_events(self, populated_timeline):
+        """Test lazily iterating over filtered events."""
+        events = populated_timeline.iter_events(event_type="session_start", limit=1)
+
+        assert not isinstance(events, list)
+        assert [e.actor for e in events] == ["agent_001"]
+
+    def test_iter_events_reflects_direct_changes(self, populated_timeline):
+        """Test that iteration sees replaced lists and mutated events."""
+        event = populated_timeline.events[1]
+        event.event_type = "memory_updated"
+
+        assert list(populated_timeline.iter_events(event_type="memory_updated")) == [event]
+
+        populated_timeline.events = [event]
+
+        assert list(populated_timeline.iter_events(actor="agent_002")) == []
+        assert list(populated_timeline.iter_events(actor="agent_001", limit=5)) == [event]
+
+    def test_get_events_no_match(self, populated_timeline):
+        """Test filtering on values that have no events."""
+        assert populated_timeline.get_events(event_type="missing") == []
+        assert populated_timeline.get_events(
+            event_type="session_end",
+            actor="agent_002"
+        ) == []
+
+    def test_get_events_after_direct_append(self, populated_timeline):
+        """Test that events added to the list directly are still found."""
+        event = TimelineEvent(
+            id="evt_manual",
+            timestamp="2025-01-01T00:00:00Z",
+            event_type="manual",
+            actor="agent_003"
+        )
+        populated_timeline.events.append(event)
+
+        assert populated_timeline.get_events(actor="agent_003") == [event]
+
+    def test_get_events_after_list_replaced(self, populated_timeline):
+        """Test that replacing events or the list itself is reflected."""
+        event = TimelineEvent(
+            id="evt_manual",
+            timestamp="2025-01-01T00:00:00Z",
+            event_type="manual",
+            actor="agent_003"
+        )
+        populated_timeline.events[0] = event
+
+        assert populated_timeline.get_events(actor="agent_003") == [event]
+        assert len(populated_timeline.get_events(event_type="session_start")) == 1
+
+        populated_timeline.events = [event]
+
+        assert populated_timeline.get_events(event_type="session_start") == []
+
+    def test_get_events_after_event_mutated(self, populated_timeline):
+        """Test that filters see changes made to events after append."""
+        event = populated_timeline.events[0]
+        event.actor = "carol"
+
+        assert populated_timeline.get_events(actor="carol") == [event]
+        assert event not in populated_timeline.get_events(actor="agent_001")
+
     def test_get_event_by_id(self, populated_timeline):
         """Test getting specific event by ID."""
         first_event = populated_timeline.events[0]
@@ -210,6 +289,22 @@ class TestTimelinePersistence:
         assert data["event_count"] == 2
         assert len(data["events"]) == 2
 
+    def test_save_unserializable_keeps_existing_file(self, tmp_path):
+        """Test that a failed save leaves the previous file intact."""
+        timeline = Timeline("save_test")
+        timeline.append_event("session_start", "agent_001")
+
+        output_file = tmp_path / "timeline.json"
+        timeline.save_to_file(output_file)
+        original = output_file.read_text()
+
+        timeline.append_event("bad_event", "agent_001", payload={"obj": object()})
+
+        with pytest.raises(TypeError):
+            timeline.save_to_file(output_file)
+
+        assert output_file.read_text() == original
+
     def test_load_from_file(self, tmp_path):
         """Test loading timeline from file."""
         # Create and save timeline